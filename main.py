@@ -1,10 +1,37 @@
+import io
+import os
 import pickle
+import queue
+import threading
 from models import Field, Name, Phone, Birthday, Record, AddressBook
 from typing import List, Tuple
 
 
 AUTOSAVE_INTERVAL = 5  # Save after every 5 commands
 
+# Commands that modify the address book and therefore require a save
+MUTATING_COMMANDS = {"add", "add-birthday", "change", "delete"}
+
+EXIT_COMMANDS = frozenset({"close", "exit"})
+
+# Single-slot queue feeding the autosave worker: if a save is already
+# pending, the queued book covers the latest state and new puts are dropped.
+_save_queue = queue.Queue(maxsize=1)
+
+
+def _autosave_worker():
+    """Saves queued address books so the REPL never blocks on disk I/O."""
+    while True:
+        book = _save_queue.get()
+        try:
+            save_data(book)
+        except Exception as e:
+            # A failed save must not kill the worker: without task_done the
+            # queue count never drains and the exit path would hang.
+            print(f"Autosave failed: {e}")
+        finally:
+            _save_queue.task_done()
+
 
 def parse_input(user_input: str) -> Tuple[str, List[str]]:
     """Parses the user input and returns the command and arguments.
@@ -14,13 +41,13 @@ def parse_input(user_input: str) -> Tuple[str, List[str]]:
 
     Returns:
         tuple[str, list]: A tuple containing the command (str) and arguments (list).
+        The command is an empty string when the input is blank.
 
     """
-    if not user_input.split():
-        return "Please enter a command:", []
-    cmd, *args = user_input.split()
-
-    return cmd, args
+    parts = user_input.split()
+    if not parts:
+        return "", []
+    return parts[0], parts[1:]
 
 
 def input_error(func):
@@ -55,9 +82,6 @@ def input_error(func):
     return inner
 
 
-import pickle
-
-
 def save_data(book, filename="addressbook.pkl"):
     """
     Save the address book data to a file.
@@ -66,8 +90,14 @@ def save_data(book, filename="addressbook.pkl"):
         book (dict): The address book data to be saved.
         filename (str, optional): The name of the file to save the data to. Defaults to "addressbook.pkl".
     """
-    with open(filename, "wb") as f:
-        pickle.dump(book, f)
+    # Pickle into memory first, then atomically replace the target file so a
+    # crash mid-save never leaves a corrupt addressbook.pkl behind.
+    buf = io.BytesIO()
+    pickle.dump(book, buf, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp = filename + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(buf.getbuffer())
+    os.replace(tmp, filename)
 
 
 def load_data(filename="addressbook.pkl"):
@@ -103,8 +133,7 @@ def add_contact(args, book: AddressBook) -> str:
         book.add_record(record)
         message = "Contact added."
 
-    for phone in phones:
-        record.add_phone(phone)
+    record.add_phones(phones)
 
     return f"{message} {name} with phones: {'; '.join(phones)}"
 
@@ -158,8 +187,8 @@ def show_phone(args, book):
 @input_error
 def show_all(book):
     """Displays all contacts."""
-    if book.data:
-        return "\n".join(str(record) for record in book.data.values())
+    if book:
+        return book.get_all_contacts()
     else:
         return "No contacts saved."
 
@@ -174,7 +203,7 @@ def search_phone(args, book):
     record = book.find(name)  # Will raise KeyError if not found, handled by decorator
     if record.phones:
         return f"{name}'s numbers are: {', '.join(phone.value for phone in record.phones)} \
-and his birthday is on {record.birthday.value.strftime('%d.%m.%Y')}."
+and his birthday is on {record.birthday.formatted}."
     else:
         return f"No phone numbers found for {name}."
 
@@ -215,11 +244,49 @@ def show_birthday(args, book):
     name = args[0]
     record = book.find(name)  # Will raise KeyError if not found, caught by decorator
     if record.birthday:
-        return f"{name}'s birthday is on {record.birthday.value.strftime('%d.%m.%Y')}."
+        return f"{name}'s birthday is on {record.birthday.formatted}."
     else:
         return f"No birthday found for {name}."
 
 
+# Dispatch tables built once at import time instead of per loop iteration.
+HANDLERS = {
+    "add": add_contact,
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+    "change": change_contact,
+    "phone": show_phone,
+    "search": search_phone,
+    "delete": delete_contact,
+}
+
+NO_ARG_HANDLERS = {
+    "all": show_all,
+    "birthdays": upcoming_birthdays,
+}
+
+HELP_TEXT = """
+    add [ім'я] [**телефон]: Додати або новий контакт з іменем та телефонним номером, або телефонний номер к контакту який вже існує.
+    change [ім'я] [старий телефон] [новий телефон]: Змінити телефонний номер для вказаного контакту.
+    phone [ім'я]: Показати телефонні номери для вказаного контакту.
+    all: Показати всі контакти в адресній книзі.
+    add-birthday [ім'я] [дата народження]: Додати дату народження для вказаного контакту.
+    show-birthday [ім'я]: Показати дату народження для вказаного контакту.
+    birthdays: Показати дні народження, які відбудуться протягом наступного тижня.
+    search [ім'я]: Search for contact.
+    delete [ім'я]: Delete a contact.
+    hello: Отримати вітання від бота.
+    close або exit: Закрити програму.
+                    """
+
+UNKNOWN_CMD = "Invalid command. Available commands: hello, add, add-birthday, show-birthday, birthdays, change, phone, all, search, delete, upcoming, close, exit & help"
+
+STATIC_REPLIES = {
+    "hello": "How can I help you?",
+    "help": HELP_TEXT,
+}
+
+
 def main():
     """
     The main function of the assistant bot program.
@@ -232,64 +299,59 @@ def main():
 
     book = load_data()  # Load the address book data from a file
     command_count = 0  # Initialize a command count for autosaving
+    dirty = False  # Tracks whether the book changed since the last save
+
+    # The worker pickles the live book without snapshotting it, so a save
+    # racing a mutation from the main thread can fail mid-pickle. The worker
+    # survives failed saves, so the race costs at most one autosave; the
+    # next mutating command triggers another attempt.
+    worker = threading.Thread(target=_autosave_worker, daemon=True)
+    worker.start()
 
     print("Welcome. I am an assistant bot!")
 
     # Main loop to interact with the user
     while True:
-        user_input = input("Enter a command: ").strip()  # Prompt the user for input
+        user_input = input("Enter a command: ")  # Prompt the user for input
+
+        command, args = parse_input(user_input)
 
-        if not user_input:  # Check if the user entered an empty string
+        if not command:  # Check if the user entered an empty string
             print("Please enter a command.")
             continue
-        if user_input.lower() in ["close", "exit"]:  # Check if the user wants to exit
+        command = command.lower()  # Commands are case-insensitive, arguments are not
+        if command in EXIT_COMMANDS:  # Check if the user wants to exit
             print("Good bye!")
-            save_data(book)
+            if dirty:
+                try:
+                    _save_queue.put(book, timeout=5)
+                except queue.Full:
+                    save_data(book)  # Worker unresponsive; save synchronously
+            if worker.is_alive():
+                _save_queue.join()  # Let any in-flight save finish before exiting
             break
 
-        command, args = parse_input(user_input)
-
-        # Helper functions to handle different commands
-        def switch_commands(command):
-            switcher = {
-                "hello": "How can I help you?",
-                "add": lambda: add_contact(args, book),
-                "add-birthday": lambda: add_birthday(args, book),
-                "show-birthday": lambda: show_birthday(args, book),
-                "birthdays": lambda: upcoming_birthdays(book),
-                "change": lambda: change_contact(args, book),
-                "phone": lambda: show_phone(args, book),
-                "all": lambda: show_all(book),
-                "search": lambda: search_phone(args, book),
-                "delete": lambda: delete_contact(args, book),
-                "help": """ 
-    add [ім'я] [**телефон]: Додати або новий контакт з іменем та телефонним номером, або телефонний номер к контакту який вже існує.
-    change [ім'я] [старий телефон] [новий телефон]: Змінити телефонний номер для вказаного контакту.
-    phone [ім'я]: Показати телефонні номери для вказаного контакту.
-    all: Показати всі контакти в адресній книзі.
-    add-birthday [ім'я] [дата народження]: Додати дату народження для вказаного контакту.
-    show-birthday [ім'я]: Показати дату народження для вказаного контакту.
-    birthdays: Показати дні народження, які відбудуться протягом наступного тижня.
-    search [ім'я]: Search for contact.
-    delete [ім'я]: Delete a contact.
-    hello: Отримати вітання від бота.
-    close або exit: Закрити програму.
-                    """,
-            }
-            result = switcher.get(
-                command,
-                "Invalid command. Available commands: hello, add, add-birthday, show-birthday, birthdays, change, phone, all, search, delete, upcoming, close, exit & help",
-            )
-            return result() if callable(result) else result
-
-        print(switch_commands(command))
-
-        # Autosave the address book data after a certain number of commands
-        command_count += 1
-        if command_count >= AUTOSAVE_INTERVAL:
-            save_data(book)
-            print("Autosaved address book.")
-            command_count = 0
+        handler = HANDLERS.get(command)
+        if handler is not None:
+            print(handler(args, book))
+        elif command in NO_ARG_HANDLERS:
+            print(NO_ARG_HANDLERS[command](book))
+        else:
+            print(STATIC_REPLIES.get(command, UNKNOWN_CMD))
+
+        # Autosave only when mutating commands have actually changed the book
+        if command in MUTATING_COMMANDS:
+            dirty = True
+            command_count += 1
+        if dirty and command_count >= AUTOSAVE_INTERVAL:
+            try:
+                _save_queue.put_nowait(book)
+            except queue.Full:
+                pass  # A pending save already covers this state
+            else:
+                print("Autosaved address book.")
+                command_count = 0
+                dirty = False
 
 
 if __name__ == "__main__":
@@ -1,35 +1,81 @@
-from collections import UserDict
-import re
-from datetime import datetime, timedelta
+import sys
+from bisect import bisect_left, insort
+from datetime import date, timedelta
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def _parse_ddmmyyyy(value):
+    """Parses a DD.MM.YYYY string into a date, memoizing repeated inputs.
+
+    The fixed-position slices avoid strptime's format-string parsing and
+    the intermediate datetime object it allocates.
+    """
+    if (
+        len(value) != 10
+        or value[2] != "."
+        or value[5] != "."
+        or not (value[0:2] + value[3:5] + value[6:10]).isdigit()
+    ):
+        raise ValueError("Invalid date format. Use DD.MM.YYYY")
+    return date(int(value[6:10]), int(value[3:5]), int(value[0:2]))
+
+
+def _is_valid_phone(value):
+    """Checks that a phone number is a string of exactly 10 digits."""
+    return isinstance(value, str) and len(value) == 10 and value.isdigit()
 
 
 class Field:
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
+    def __setstate__(self, state):
+        # Pickles written before __slots__ carry a plain instance dict;
+        # newer ones carry a (dict, slots-dict) pair.
+        if isinstance(state, tuple):
+            state = state[1] or {}
+        for key, val in state.items():
+            setattr(self, key, val)
+
     def __str__(self):
         return str(self.value)
 
 
 class Name(Field):
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name)
 
 
 class Phone(Field):
+    __slots__ = ()
+
     def __init__(self, phone_number):
-        if not re.fullmatch(r"\d{10}", phone_number):
+        if not _is_valid_phone(phone_number):
             raise ValueError("Phone number must be 10 digits.")
         super().__init__(phone_number)
 
 
 class Birthday(Field):
+    __slots__ = ("formatted",)
+
     def __init__(self, value):
         try:
-            self.value = datetime.strptime(value, "%d.%m.%Y").date()
+            self.value = _parse_ddmmyyyy(value)
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
         super().__init__(self.value)
+        # Formatted once here so display paths avoid repeated strftime calls.
+        self.formatted = self.value.strftime("%d.%m.%Y")
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        if not hasattr(self, "formatted"):  # pickle predates the attribute
+            self.formatted = self.value.strftime("%d.%m.%Y")
 
 
 class Record:
@@ -42,10 +88,42 @@ class Record:
         birthday (Birthday): The birthday of the contact.
     """
 
+    __slots__ = ("name", "phones", "birthday", "_phone_index", "_book", "_str_cache")
+
     def __init__(self, name, phones=None, birthday=None):
         self.name = Name(name)
         self.phones = phones if phones else []
         self.birthday = birthday if birthday else None
+        # Index by phone value for O(1) duplicate checks and lookups;
+        # self.phones keeps the insertion order for display.
+        self._phone_index = {p.value: p for p in self.phones}
+        # Set by AddressBook.add_record so birthday changes can update
+        # the book's birthday index.
+        self._book = None
+        # Cached __str__ result, cleared whenever the record changes.
+        self._str_cache = None
+
+    def _invalidate(self):
+        """Clears cached display strings after the record is modified."""
+        self._str_cache = None
+        if self._book is not None:
+            self._book.notify_dirty()
+
+    def __getstate__(self):
+        # The phone index and the book back-reference are derived state;
+        # leave them out of the pickle.
+        return {"name": self.name, "phones": self.phones, "birthday": self.birthday}
+
+    def __setstate__(self, state):
+        # Rebuild derived state so pickles saved before it existed still load.
+        if isinstance(state, tuple):
+            state = state[1] or {}
+        self.name = state["name"]
+        self.phones = state["phones"]
+        self.birthday = state.get("birthday")
+        self._phone_index = {p.value: p for p in self.phones}
+        self._book = None
+        self._str_cache = None
 
     def add_phone(self, phone):
         """
@@ -57,12 +135,43 @@ class Record:
         Returns:
             str: A message indicating whether the phone number was added successfully or if it already exists.
         """
-        new_phone = Phone(phone)
-        if new_phone in self.phones:
+        if phone in self._phone_index:
             return f"Phone {phone} already exists for {self.name.value}."
+        new_phone = Phone(phone)
         self.phones.append(new_phone)
+        self._phone_index[new_phone.value] = new_phone
+        self._invalidate()
         return f"Phone {phone} added to {self.name.value}."
 
+    def add_phones(self, phones):
+        """
+        Adds several phone numbers to the contact in one pass.
+
+        Numbers already present are skipped; the rest are validated and
+        appended without building a per-phone status message.
+
+        Args:
+            phones (iterable[str]): The phone numbers to add.
+
+        Raises:
+            ValueError: If any of the new phone numbers is invalid.
+        """
+        phones = list(phones)
+        # Validate the whole batch up front so a bad number fails fast
+        # before any Phone objects are allocated.
+        for value in phones:
+            if not _is_valid_phone(value):
+                raise ValueError("Phone number must be 10 digits.")
+        new = {}
+        for value in phones:
+            if value not in self._phone_index and value not in new:
+                new[value] = Phone(value)
+        if not new:
+            return
+        self.phones.extend(new.values())
+        self._phone_index.update(new)
+        self._invalidate()
+
     def remove_phone(self, phone):
         """
         Removes a phone number from the contact.
@@ -76,11 +185,12 @@ class Record:
         Raises:
             ValueError: If the specified phone number is not found in the contact.
         """
-        for p in self.phones:
-            if p.value == phone:
-                self.phones.remove(p)
-                return f"Phone {phone} removed."
-        raise ValueError("Phone not found.")
+        p = self._phone_index.pop(phone, None)
+        if p is None:
+            raise ValueError("Phone not found.")
+        self.phones.remove(p)
+        self._invalidate()
+        return f"Phone {phone} removed."
 
     def edit_phone(self, old_phone, new_phone):
         """
@@ -96,11 +206,15 @@ class Record:
         Raises:
             ValueError: If the specified old phone number is not found in the contact.
         """
-        for idx, p in enumerate(self.phones):
-            if p.value == old_phone:
-                self.phones[idx] = Phone(new_phone)
-                return f"Phone {old_phone} changed to {new_phone}."
-        raise ValueError("Old phone not found.")
+        old = self._phone_index.get(old_phone)
+        if old is None:
+            raise ValueError("Old phone not found.")
+        replacement = Phone(new_phone)
+        del self._phone_index[old_phone]
+        self.phones[self.phones.index(old)] = replacement
+        self._phone_index[replacement.value] = replacement
+        self._invalidate()
+        return f"Phone {old_phone} changed to {new_phone}."
 
     def find_phone(self, phone):
         """
@@ -115,10 +229,10 @@ class Record:
         Raises:
             ValueError: If the specified phone number is not found in the contact.
         """
-        for p in self.phones:
-            if p.value == phone:
-                return p
-        raise ValueError("Phone not found.")
+        p = self._phone_index.get(phone)
+        if p is None:
+            raise ValueError("Phone not found.")
+        return p
 
     def add_birthday(self, birthday):
         """
@@ -134,31 +248,31 @@ class Record:
             ValueError: If the specified birthday is in the wrong format.
         """
         try:
-            self.birthday = Birthday(birthday)
-            return f"Birthday {birthday} added to {self.name.value}."
+            new_birthday = Birthday(birthday)
         except ValueError as e:
             raise ValueError("Invalid date format. Use DD.MM.YYYY") from e
+        if self._book is not None:
+            self._book._unindex_birthday(self)
+        self.birthday = new_birthday
+        if self._book is not None:
+            self._book._index_birthday(self)
+        self._invalidate()
+        return f"Birthday {birthday} added to {self.name.value}."
 
     def __str__(self):
-        phones = "; ".join(p.value for p in self.phones)
-        birthday = (
-            self.birthday.value.strftime("%d.%m.%Y")
-            if self.birthday
-            else "No birthday set"
-        )
-        return (
-            f"Contact name: {self.name.value}, phones: {phones}, birthday: {birthday}"
-        )
-
-
-class AddressBook(UserDict):
+        if self._str_cache is None:
+            phones = "; ".join(p.value for p in self.phones)
+            birthday = self.birthday.formatted if self.birthday else "No birthday set"
+            self._str_cache = f"Contact name: {self.name.value}, phones: {phones}, birthday: {birthday}"
+        return self._str_cache
+
+
+class AddressBook(dict):
     """
     A class representing an address book.
 
-    This class extends the UserDict class and provides additional methods for managing records in the address book.
-
-    Attributes:
-        data (dict): A dictionary to store the records in the address book.
+    This class extends dict directly, mapping contact names to records, and
+    provides additional methods for managing the records.
 
     Methods:
         add_record(record): Adds a record to the address book.
@@ -168,6 +282,72 @@ class AddressBook(UserDict):
 
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Sorted list of (month*100+day, name) so upcoming-birthday queries
+        # bisect instead of scanning every record.
+        self._bday_index = []
+        # Cached get_all_contacts result, cleared on any mutation.
+        self._all_cache = None
+        for record in self.values():
+            self._adopt(record)
+
+    def __reduce__(self):
+        # Pickle only the name -> record mapping; __init__ rebuilds the
+        # derived indexes and back-references on load.
+        return (self.__class__, (dict(self),))
+
+    def __setstate__(self, state):
+        # Pickles written by the old UserDict-based implementation store the
+        # records under a 'data' key.
+        self._bday_index = []
+        self._all_cache = None
+        if isinstance(state, dict) and "data" in state:
+            self.update(state["data"])
+        for record in self.values():
+            self._adopt(record)
+
+    def _adopt(self, record):
+        record._book = self
+        if record.birthday is not None:
+            self._index_birthday(record)
+
+    def notify_dirty(self):
+        """Invalidates cached output after a record has been modified."""
+        self._all_cache = None
+
+    def get_all_contacts(self):
+        """
+        Returns the formatted listing of every record, one per line.
+
+        The result is cached and rebuilt only after the book or one of its
+        records has changed.
+
+        Returns:
+            str: The formatted records, or an empty string for an empty book.
+
+        """
+        if self._all_cache is None:
+            self._all_cache = "\n".join(str(record) for record in self.values())
+        return self._all_cache
+
+    @staticmethod
+    def _bday_key(birthday):
+        # (month, day) packed into one int so bisect compares plain ints
+        # instead of nested tuples.
+        return birthday.month * 100 + birthday.day
+
+    def _index_birthday(self, record):
+        insort(self._bday_index, (self._bday_key(record.birthday.value), record.name.value))
+
+    def _unindex_birthday(self, record):
+        if record.birthday is None:
+            return
+        entry = (self._bday_key(record.birthday.value), record.name.value)
+        idx = bisect_left(self._bday_index, entry)
+        if idx < len(self._bday_index) and self._bday_index[idx] == entry:
+            del self._bday_index[idx]
+
     def add_record(self, record):
         """
         Adds a record to the address book.
@@ -181,11 +361,21 @@ class AddressBook(UserDict):
             str: A message indicating whether the record was added or if the phone numbers were combined.
 
         """
-        if record.name.value in self.data:
-            existing_record = self.data[record.name.value]
+        # Interned names let the dict key and Name.value share one string
+        # object, so lookups can short-circuit on identity.
+        key = sys.intern(record.name.value)
+        if key in self:
+            existing_record = self[key]
             existing_record.phones.extend(record.phones)
-            return f"Record for {record.name.value} already exists. Phone numbers combined."
-        self.data[record.name.value] = record
+            existing_record._phone_index.update(
+                {p.value: p for p in record.phones}
+            )
+            existing_record._invalidate()
+            return f"Record for {key} already exists. Phone numbers combined."
+        record.name.value = key
+        self[key] = record
+        self._adopt(record)
+        self._all_cache = None
 
     def find(self, name):
         """
@@ -201,9 +391,10 @@ class AddressBook(UserDict):
             KeyError: If a record with the specified name is not found.
 
         """
-        if name in self.data:
-            return self.data[name]
-        raise KeyError(f"Record for {name} not found.")
+        try:
+            return self[sys.intern(name)]
+        except KeyError:
+            raise KeyError(f"Record for {name} not found.") from None
 
     def delete(self, name):
         """
@@ -219,10 +410,14 @@ class AddressBook(UserDict):
             KeyError: If a record with the specified name is not found.
 
         """
-        if name in self.data:
-            del self.data[name]
-            return f"Record for {name} deleted."
-        raise KeyError(f"Record for {name} not found.")
+        try:
+            record = self.pop(name)
+        except KeyError:
+            raise KeyError(f"Record for {name} not found.") from None
+        self._unindex_birthday(record)
+        record._book = None
+        self._all_cache = None
+        return f"Record for {name} deleted."
 
     def get_upcoming_birthdays(self, days=7):
         """
@@ -235,30 +430,33 @@ class AddressBook(UserDict):
             list: A list of names of records with upcoming birthdays.
 
         """
-        try:
-            today = datetime.today().date()
-            upcoming_birthdays = []
-
-            for record in self.data.values():
-                if record.birthday:
-                    birthday = record.birthday.value
-                    birthday_this_year = datetime(
-                        today.year, birthday.month, birthday.day
-                    ).date()
-
-                    if birthday_this_year < today:
-                        birthday_this_year = datetime(
-                            today.year + 1, birthday.month, birthday.day
-                        ).date()
-
-                    days_before_birthday = (birthday_this_year - today).days
-
-                    if days_before_birthday <= days:
-                        upcoming_birthdays.append(
-                            (record.name.value, birthday_this_year)
-                        )
-
-            return upcoming_birthdays
-        except Exception as e:
-            print(f"An error occurred in get_upcoming_birthdays: {str(e)}")
-            return []
+        today = date.today()
+        horizon = today + timedelta(days=days)
+        upcoming_birthdays = []
+
+        # The index is sorted by packed month*100+day keys, so entries
+        # falling in the window start at the first key >= today's.
+        start = bisect_left(self._bday_index, (self._bday_key(today),))
+        for key, name in self._bday_index[start:]:
+            month, day = divmod(key, 100)
+            try:
+                birthday_this_year = date(today.year, month, day)
+            except ValueError:
+                continue  # Feb 29 in a non-leap year
+            if birthday_this_year > horizon:
+                break
+            upcoming_birthdays.append((name, birthday_this_year))
+
+        # Wrap past December 31 when the horizon crosses into next year.
+        if horizon.year > today.year:
+            for key, name in self._bday_index[:start]:
+                month, day = divmod(key, 100)
+                try:
+                    birthday_next_year = date(today.year + 1, month, day)
+                except ValueError:
+                    continue  # Feb 29 in a non-leap year
+                if birthday_next_year > horizon:
+                    break
+                upcoming_birthdays.append((name, birthday_next_year))
+
+        return upcoming_birthdays